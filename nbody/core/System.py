@@ -7,6 +7,7 @@ from ..utils.exceptions import DimensionError
 from ..utils.validation import validate_time
 from ..utils.Counter import Counter
 from .Sphere import Sphere
+from .cuda import cuda_accel
 
 from time import time
 import numpy as np
@@ -18,6 +19,47 @@ try:
 except ImportError:
     cupy_imported = False
 
+try:
+    from .kernels import verlet_step
+    numba_imported = True
+except ImportError:
+    # Falling back on the ahead-of-time compiled kernels, which need no
+    # numba at runtime; built once with 'python -m nbody.core.aot'
+    try:
+        from . import kernels_aot as _aot
+
+        def verlet_step(x_prev, v_prev, w_prev, x_new, v_new, w_new, mass,
+                        charge, radius, G, k, cf, dt, collision):
+            real = x_prev.dtype.type
+            if x_prev.dtype == np.float32:
+                step = _aot.verlet_step_f4
+            else:
+                step = _aot.verlet_step_f8
+            step(x_prev, v_prev, w_prev, x_new, v_new, w_new, mass, charge,
+                 radius, real(G), real(k), real(cf), real(dt), collision)
+
+        numba_imported = True
+    except ImportError:
+        numba_imported = False
+
+class _TreeNode:
+    """
+        A node in the Barnes–Hut tree; stores the bounding cube, the center
+        of mass, and the total mass and charge of the spheres it contains
+    """
+
+    __slots__ = ["center", "l", "com", "total_mass", "total_charge",
+                 "children", "idx"]
+
+    def __init__(self, center, l):
+        self.center = center
+        self.l = l
+        self.com = None
+        self.total_mass = 0
+        self.total_charge = 0
+        self.children = []
+        self.idx = None
+
 class System:
 
     def __init__(self):
@@ -29,6 +71,19 @@ class System:
         self.m = None
         self.q = None
         self.r = None
+        # Smallest system for which the GPU is auto-selected; for an O(N²)
+        # pairwise workload the transfer and launch overhead only pays off
+        # past a few thousand spheres
+        self._gpu_threshold = 2048
+        # Over-allocated buffers backing the per-sphere arrays; 'add' grows
+        # them geometrically, and exposes the first N rows as views
+        self._capacity = 0
+        self._x0_buf = None
+        self._v0_buf = None
+        self._w0_buf = None
+        self._m_buf = None
+        self._q_buf = None
+        self._r_buf = None
         self.attribute_reset()
 
     def attribute_reset(self):
@@ -63,6 +118,11 @@ class System:
                    f"list containing compatible 'Sphere' objects.")
             raise TypeError(msg)
 
+        # An empty sequence is a valid no-op; returning before the buffer
+        # logic, which needs at least one sphere to size itself from
+        if len(spheres) == 0:
+            return
+
         # Dimension Checking
         for n,sphere in enumerate(spheres):
             if n == 0:
@@ -71,132 +131,199 @@ class System:
                 if sphere.p != p:
                     raise DimensionError(p, sphere.p)
 
-        for sphere in spheres:
-            # If the System is empty, initializes it
-            if self.N is None:
-                self.x0 = np.array(sphere.x0)
-                self.v0 = np.array(sphere.v0)
-                self.w0 = np.array(sphere.w0)
-                self.m = np.array(sphere.m)
-                self.q = np.array(sphere.q)
-                self.r = np.array(sphere.r)
-                self.N = 1
-                self.p = self.x0.shape[1]
-            else:
-                # Updating the number of spheres
-                self.N += 1
-
-                # Updating the initial conditions for position, velocity, and
-                # angular velocity
-                self.x0 = np.vstack([self.x0, sphere.x0])
-                self.v0 = np.vstack([self.v0, sphere.v0])
-                self.w0 = np.vstack([self.w0, sphere.w0])
-                # Including the new sphere's mass, charge, and radius
-                self.m = np.vstack([self.m, sphere.m])
-                self.q = np.vstack([self.q, sphere.q])
-                self.r = np.vstack([self.r, sphere.r])
+        names = ["x0", "v0", "w0", "m", "q", "r"]
+        N = 0 if self.N is None else self.N
+
+        # Growing the over-allocated buffers when the capacity runs out;
+        # doubling keeps the build amortized O(1) per added sphere, where
+        # np.vstack reallocated and copied every existing row on each add.
+        # The buffers are also rebuilt if the arrays were assigned directly
+        # (e.g. by the generators), in which case they are staged in first
+        if (N + len(spheres) > self._capacity
+                or (N > 0 and self.x0.base is not self._x0_buf)):
+            self._capacity = max(2*self._capacity, N + len(spheres))
+            for name in names:
+                # Column counts and dtypes come from the existing arrays, or
+                # from the first new sphere if the System is empty
+                if N > 0:
+                    old = getattr(self, name)
+                else:
+                    old = getattr(spheres[0], name)
+                buf = np.zeros((self._capacity, old.shape[1]), old.dtype)
+                buf[:N] = old[:N]
+                setattr(self, "_" + name + "_buf", buf)
+
+        # Writing each new sphere into the next free rows of the buffers
+        for n,sphere in enumerate(spheres, start = N):
+            for name in names:
+                getattr(self, "_" + name + "_buf")[n] = getattr(sphere, name)
+
+        # Updating the number of spheres, and exposing the filled rows of
+        # the buffers as the per-sphere arrays
+        self.N = N + len(spheres)
+        self.p = self._x0_buf.shape[1]
+        for name in names:
+            setattr(self, name, getattr(self, "_" + name + "_buf")[:self.N])
 
         # Resetting the object to its original state, including the new data
         self.attribute_reset()
 
-    def _test_GPU(self, collision):
+    def _test_GPU(self):
         """
-            Runs several iterations of an algorithm similar to the one used in
-            the solve() method to gauge whether or not the GPU should be used
+            Decides whether the GPU should be used, from a static cost
+            model: the O(N²) pairwise workload amortizes the GPU transfer
+            and launch overhead once N exceeds 'self._gpu_threshold'
 
-            If the CPU performs best or cupy isn't installed, returns False
-            If the GPU performs best, returns True
+            If cupy isn't installed or the system is too small, returns
+            False; returns True otherwise
         """
-        if not cupy_imported:
-            return False
-
-        times = []
-
-        # An algorithm similar to that used in the solve() method
-        for mod, GPU in zip([cp, np], [True, False]):
-            a = mod.random.normal(0, 0.5, (self.N, 1))
-            b = mod.random.normal(0, 0.5, (self.N, self.p))
-
-            t0 = time()
-            foo = mod.linalg.norm(a*b, axis = 1)[:,np.newaxis]
-            for n in range(0, 10):
-                c = self._arr_del(arr = a, n = 0, GPU = GPU, axis = 0)
-                c = self._arr_del(arr = a, n = 0, GPU = GPU, axis = 0)
-                c = self._arr_del(arr = a, n = 0, GPU = GPU, axis = 0)
-                d = self._arr_del(arr = b, n = 0, GPU = GPU, axis = 0)
-                c = mod.linalg.norm(d, axis = 1)[:,np.newaxis]
-                e = self._a_inv_square(m1 = 1.1, m2 = c, d2 = d, dn = c,
-                                       q1 = 1.1, q2 = 1.1, G = 1.1, k = 1.1,
-                                       mod = mod)
-                if collision:
-                    a = a + self._a_collision(m1 = 1.1, m2 = c, r1 = 1.1,
-                                              r2 = c, v1 = d[0], v2 = d,
-                                              w1 = d[0], w2 = d, d2 = d,
-                                              dn = c, cf = 1.1, mod = mod,
-                                              dt = 1.1)
-                c = 0.5*(c+1)
-            times.append(time() - t0)
-        return times[0] < times[1]
-
-    def _a_inv_square(self, m1, m2, d2, dn, q1, q2, G, k, mod):
+        return cupy_imported and self.N > self._gpu_threshold
+
+    def _a_inv_square(self, coef, d2, inv_r3, mod):
         """
-            Calculates the total acceleration on a sphere due to
-            gravitational and Coulomb interactions, from all other spheres
-
-            m1  – mass of current sphere
-            m2  – masses of all other spheres
-            q1  – charge of current sphere
-            q2  – charges of all other spheres
-            d2  – vectors pointing from all spheres, toward the current one
-            dn  – distances between all spheres and current sphere
-
-            G   – universal gravitational constant: 6.67430E−11
-            k   – electrostatic constant: 8.9875517887E9
+            Calculates the accelerations on all spheres due to gravitational
+            and Coulomb interactions, batched over every pair of spheres
+
+            coef    – gravitational and Coulomb coefficient for each pair of
+                      spheres, G*m_j + k*q_i*q_j/m_i; constant throughout
+                      the simulation, so it is precomputed once in solve();
+                      shape (N,N)
+            d2      – vectors pointing from each sphere, toward every other
+                      sphere; shape (N,N,p)
+            inv_r3  – inverse cube of the pairwise distances, with zeros on
+                      the diagonal so self-interactions vanish; shape (N,N);
+                      consumed as scratch space
         """
-        # Calculating gravitational acceleration
-        a_g = G*m2
-        # Calculating Coulomb acceleration
-        a_c = k*q2*q1/m1
-        return mod.sum((a_g + a_c)*d2/dn, axis = 0)
-
-    def _a_collision(self, m1, m2, r1, r2, v1, v2, w1, w2, d2, dn, cf, mod, dt):
+        # Fusing the pair coefficients into the inverse cube buffer in
+        # place, then contracting straight to (N,p); this avoids both the
+        # (N,N) coefficient copy and the (N,N,p) pairwise acceleration
+        # tensor of the separate multiply-and-sum passes
+        mod.multiply(coef, inv_r3, out = inv_r3)
+        return mod.einsum('ij,ijk->ik', inv_r3, d2)
+
+    def _a_collision(self, mass, radius, v, d2, dn, cf, mod, dt):
         """
-            Calculates the total acceleration of a sphere due to collisions
-            with all the other spheres
-
-            m1  – mass of current sphere
-            m2  – masses of all other spheres
-            r1  – radius of current sphere
-            r2  – radii of all other spheres
-            v1  – velocity of current sphere
-            v2  – velocities of all other spheres
-            d2  – vectors pointing from all spheres, toward the current one
-            dn  – distances between all spheres and current sphere
+            Calculates the accelerations on all spheres due to collisions,
+            batched over every pair of spheres
+
+            mass    – masses of all spheres; shape (N,1)
+            radius  – radii of all spheres; shape (N,1)
+            v       – velocities of all spheres; shape (N,p)
+            d2      – vectors pointing from each sphere, toward every other
+                      sphere; shape (N,N,p)
+            dn      – distances between all pairs of spheres, with infinity
+                      on the diagonal; shape (N,N)
 
             cf  – force coefficient for collision
             mod – cupy if the GPU is active, numpy otherwise
             dt  – integration time-step
         """
-        # Indices of spheres that are colliding with current sphere
-        idx = (dn <= r2+r1).flatten()
+        m = mass[:,0]
+        r = radius[:,0]
+        # 0/1 mask over the pairs of spheres that are currently
+        # intersecting; multiplying by it is branchless, so the whole body
+        # stays in SIMD-friendly elementwise passes
+        mask = (dn <= r[None,:] + r[:,None]).astype(dn.dtype)
+        # Sum of the masses for each pair of spheres
+        m_sum = m[:,None] + m[None,:]
         # Find acceleration by conservation laws for elastic collisions
-        a_c = v1*(m1-m2[idx])/(m1+m2[idx]) + 2*m2[idx]*v2[idx]/(m1+m2[idx])
-        # Make the collision acceleration a scalar quantity
-        a_c = mod.linalg.norm(a_c, axis = 1)[:,np.newaxis]
-        return -cf*mod.sum(a_c*d2[idx]/dn[idx], axis = 0)/dt
-
-    def _arr_del(self, arr, n, GPU, axis):
+        a_c = v[:,None,:]*((m[:,None] - m[None,:])/m_sum)[:,:,None] \
+              + (2*m[None,:]/m_sum)[:,:,None]*v[None,:,:]
+        # Make the collision acceleration a scalar quantity; the einsum
+        # self-contraction reduces straight along the last axis, where the
+        # general-purpose linalg.norm costs an extra pass
+        a_c = mod.sqrt(mod.einsum('ijk,ijk->ij', a_c, a_c))
+        # Keeping only the pairs that are actually colliding; the masked
+        # diagonal zeroes out against the infinite self-distances
+        a_c = a_c*(mask/dn)
+        # Contracting straight to (N,p), without materializing the (N,N,p)
+        # pairwise acceleration tensor
+        return -cf*mod.einsum('ij,ijk->ik', a_c, d2)/dt
+
+    def _build_tree(self, x, mass, charge, n_leaf = 1):
         """
-            Deletes an element from an array, for both cupy and numpy
+            Builds a Barnes–Hut tree over the spheres at positions 'x' by
+            recursively subdividing the bounding cube into 2^p children
+            (a quadtree for p=2, an octree for p=3) until each leaf holds
+            at most 'n_leaf' spheres
+
+            x       – positions of all spheres; shape (N,p)
+            mass    – masses of all spheres; shape (N,1)
+            charge  – charges of all spheres; shape (N,1)
         """
-        if n == 0:
-            return arr[n+1:]
-        elif n == arr.shape[0] - 1:
-            return arr[:n]
-        elif GPU is True:
-            return cp.concatenate([arr[:n], arr[n+1:]])
+        x_min = x.min(axis = 0)
+        x_max = x.max(axis = 0)
+        # Center and side length of the bounding cube
+        center = 0.5*(x_min + x_max)
+        l = (x_max - x_min).max()
+        idx = np.arange(x.shape[0])
+        return self._subdivide(x, mass, charge, idx, center, l, n_leaf)
+
+    def _subdivide(self, x, mass, charge, idx, center, l, n_leaf):
+        """
+            Recursive helper for '_build_tree'; creates the node that covers
+            the spheres listed in 'idx', and subdivides it if necessary
+        """
+        node = _TreeNode(center, l)
+        node.total_mass = mass[idx,0].sum()
+        node.total_charge = charge[idx,0].sum()
+        # Center of mass of all spheres contained in this node
+        node.com = (x[idx]*mass[idx]).sum(axis = 0)/node.total_mass
+
+        # Stop subdividing once the leaf is small enough; the check on the
+        # side length guards against coincident spheres recursing forever,
+        # and is written to also stop on a NaN side length (from non-finite
+        # positions), which would otherwise recurse without bound
+        if idx.shape[0] <= n_leaf or not (l >= 1E-10):
+            node.idx = idx
+            return node
+
+        # Assigning each sphere to one of the 2^p octants
+        keys = ((x[idx] > center) << np.arange(self.p)).sum(axis = 1)
+        for key in range(2**self.p):
+            sub_idx = idx[keys == key]
+            if sub_idx.shape[0] == 0:
+                continue
+            # Offsetting the child's center by l/4 along each axis
+            signs = 2*((key >> np.arange(self.p)) & 1) - 1
+            sub_center = center + 0.25*l*signs
+            node.children.append(self._subdivide(x, mass, charge, sub_idx,
+                                                 sub_center, 0.5*l, n_leaf))
+        return node
+
+    def _tree_force(self, n, node, x, mass, charge, G, k, theta):
+        """
+            Returns the gravitational and Coulomb acceleration on sphere 'n'
+            from the given node, using the node's pseudo-particle if the
+            opening criterion l/d < theta is satisfied, and recursing into
+            its children otherwise
+        """
+        a = np.zeros(self.p)
+        if node.idx is not None:
+            # Leaf node; sum the spheres it contains directly
+            for j in node.idx:
+                if j == n:
+                    continue
+                d2 = x[j] - x[n]
+                r2 = d2 @ d2
+                coef = (G*mass[j,0]
+                        + k*charge[j,0]*charge[n,0]/mass[n,0])*r2**-1.5
+                a = a + coef*d2
+            return a
+
+        d2 = node.com - x[n]
+        r2 = d2 @ d2
+        if node.l*node.l < theta*theta*r2:
+            # Node is far enough away to be treated as a pseudo-particle
+            coef = (G*node.total_mass
+                    + k*node.total_charge*charge[n,0]/mass[n,0])*r2**-1.5
+            return coef*d2
         else:
-            return np.delete(arr, n, axis = axis)
+            # Node is too close; recurse into its children
+            for child in node.children:
+                a = a + self._tree_force(n, child, x, mass, charge, G, k,
+                                         theta)
+            return a
 
     def simulation_info(self):
         """
@@ -218,17 +345,37 @@ class System:
                    f"\t\t\t{GPU}\n\tCollisions\t\t{col}")
         return msg
 
-    def solve(self, T, dt = None, collision = True, GPU = None, debug = True):
+    def solve(self, T, dt = None, collision = True, GPU = None, debug = True,
+              tree = False, theta = 0.5, dtype = np.float32,
+              save_every = 1):
         # Auto-selecting dt if None
         if dt is None:
             dt = T/500
         else:
-            dt = validate_time(dt)
-        T = validate_time(T)
-
-        # Auto-selecting cupy or numpy depending on system/simulation
+            dt = float(validate_time(dt))
+        T = float(validate_time(T))
+
+        # The O(N log N) Barnes–Hut tree only covers the gravitational and
+        # Coulomb interactions; collisions need the direct O(N²) pairwise sum
+        if tree and collision:
+            if debug:
+                print("Cannot combine tree mode with collisions – "
+                      "falling back on the direct pairwise sum")
+            tree = False
+
+        # The tree is walked on the CPU; cupy arrays would bounce back and
+        # forth between devices on every step
+        if tree:
+            GPU = False
+
+        # Auto-selecting cupy or numpy depending on system size
         if GPU is None:
-            GPU = self._test_GPU(collision)
+            GPU = self._test_GPU()
+
+        # Without cupy an explicit GPU=True can only run on the CPU; the
+        # flag is dropped here so the CUDA kernel is never reached
+        if not cupy_imported:
+            GPU = False
 
         # If GPU is selected or overwritten, uses cupy.  Uses numpy otherwise
         if cupy_imported is True and GPU:
@@ -251,24 +398,37 @@ class System:
         if debug:
             print(self.simulation_info(), end = "\n\n")
 
-        # Initializing empty arrays for positions and velocities
-        x = mod.zeros((steps, self.N, self.p))
-        v = mod.zeros((steps, self.N, self.p))
-        w = mod.zeros((steps, self.N, self.p))
+        # Only every 'save_every'-th step is kept in the trajectory; the
+        # recurrence itself runs in a small ping-pong scratch buffer, so the
+        # history allocation shrinks accordingly
+        save_every = int(save_every)
+        if save_every < 1:
+            msg = (f"Argument 'save_every' in 'System.solve' must be a "
+                   f"positive integer; got {save_every:d}.")
+            raise ValueError(msg)
+        frames = (steps - 1)//save_every + 1
+
+        # Initializing empty arrays for positions and velocities; float32 is
+        # the default precision, which is ample for a visualization-oriented
+        # Verlet integration, at half the memory traffic of float64
+        x = mod.zeros((frames, self.N, self.p), dtype = dtype)
+        v = mod.zeros((frames, self.N, self.p), dtype = dtype)
+        w = mod.zeros((frames, self.N, self.p), dtype = dtype)
 
         # Loading masses, charges, and radii from attributes
-        mass = mod.array(self.m)
-        charge = mod.array(self.q)
-        radius = mod.array(self.r)
+        mass = mod.array(self.m, dtype = dtype)
+        charge = mod.array(self.q, dtype = dtype)
+        radius = mod.array(self.r, dtype = dtype)
 
-        # Inserting initial conditions
-        x[0] = mod.array(self.x0)
-        v[0] = mod.array(self.v0)
-        w[0] = mod.array(self.w0)
+        # Ping-pong scratch holding the two steps of the Verlet recurrence
+        x_scr = mod.zeros((2, self.N, self.p), dtype = dtype)
+        v_scr = mod.zeros((2, self.N, self.p), dtype = dtype)
+        w_scr = mod.zeros((2, self.N, self.p), dtype = dtype)
 
-        # Allocating memory for temporary variables
-        v_half = mod.zeros((self.N, self.p))
-        w_half = mod.zeros((self.N, self.p))
+        # Inserting initial conditions
+        x[0] = x_scr[0] = mod.array(self.x0)
+        v[0] = v_scr[0] = mod.array(self.v0)
+        w[0] = w_scr[0] = mod.array(self.w0)
 
         # Universal gravitational constant
         G = 6.67430E-11
@@ -277,84 +437,131 @@ class System:
         # Collision force coefficient
         cf = 0.5
 
-        # Initialize countdown timer
+        # Initialize countdown timer; one tick per half-step, so the
+        # progress bar's own overhead stays independent of N
         if debug:
-            counter = Counter(2*steps*self.N)
-
-        # Velocity Verlet Integration
-        for m in range(1, steps):
+            counter = Counter(2*steps)
+
+        # On the CPU, the compiled numba kernel performs the entire Verlet
+        # step without returning to the interpreter
+        numba_active = numba_imported and not GPU and not tree
+
+        if not numba_active and not tree and not GPU:
+            # Pre-allocating the pairwise buffers once, so the hot loop
+            # reuses them instead of churning the allocator every half-step
+            d2_buf = mod.zeros((self.N, self.N, self.p), dtype = dtype)
+            sq_buf = mod.zeros((self.N, self.N, self.p), dtype = dtype)
+            r2_buf = mod.zeros((self.N, self.N), dtype = dtype)
+            inv_r3_buf = mod.zeros((self.N, self.N), dtype = dtype)
+            if collision:
+                dn_buf = mod.zeros((self.N, self.N), dtype = dtype)
+            # The masses and charges never change during the simulation, so
+            # the pairwise force coefficient G*m_j + k*q_i*q_j/m_i is hoisted
+            # out of the timestep loop entirely
+            coef_buf = (G*mass[:,0][None,:]
+                        + k*charge[:,0][None,:]
+                          *(charge[:,0]/mass[:,0])[:,None])
+
+        def a_direct(x_step, v_step):
+            """
+                Direct O(N²) pairwise sum over accelerations at the given
+                positions and velocities; works in the pre-allocated
+                pairwise buffers
+            """
+            if GPU:
+                # Tiled CUDA kernel; stages the spheres through shared
+                # memory so every global load is reused across the block
+                a = cuda_accel(x_step, v_step, mass, charge, radius, G, k,
+                               cf, dt, collision)
+                # Display countdown timer
+                if debug:
+                    counter()
+                return a
+
+            # Vectors pointing from each sphere, toward every other sphere
+            mod.subtract(x_step[None,:,:], x_step[:,None,:], out = d2_buf)
+            # Squared distances between all pairs of spheres; cupy's einsum
+            # can't write into an existing array, so square and reduce
+            # through the buffers instead
+            mod.multiply(d2_buf, d2_buf, out = sq_buf)
+            mod.sum(sq_buf, axis = 2, out = r2_buf)
+            # Masking the diagonal so spheres don't interact with
+            # themselves; the infinity drops out of the collision mask, and
+            # its inverse cube underflows to a clean zero
+            mod.fill_diagonal(r2_buf, mod.inf)
+            # Inverse cube distances, for the inverse square law
+            mod.power(r2_buf, -1.5, out = inv_r3_buf)
+            # Sum over total gravitational and Coulomb accelerations
+            a = self._a_inv_square(coef = coef_buf, d2 = d2_buf,
+                                   inv_r3 = inv_r3_buf, mod = mod)
+            if collision:
+                # Including acceleration from intersphere collisions
+                mod.sqrt(r2_buf, out = dn_buf)
+                a = a + self._a_collision(mass = mass, radius = radius,
+                                          v = v_step, d2 = d2_buf,
+                                          dn = dn_buf, cf = cf,
+                                          mod = mod, dt = dt)
+            # Display countdown timer
+            if debug:
+                counter()
+            return a
+
+        def a_tree(x_step):
+            """
+                O(N log N) Barnes–Hut approximation of the accelerations at
+                the given positions; one tree build, then N walks
+            """
+            root = self._build_tree(x_step, mass, charge)
+            a = mod.zeros((self.N, self.p))
             # Loop over each sphere
             for n in range(0, self.N):
-                # Masses of all spheres except the current one
-                m2 = self._arr_del(arr = mass, n = n, GPU = GPU, axis = 0)
-                # Charges of all spheres except the current one
-                q2 = self._arr_del(arr = charge, n = n, GPU = GPU, axis = 0)
-                # Velocities of all spheres except the current one
-                v2 = self._arr_del(arr = v[m-1], n = n, GPU = GPU, axis = 0)
-                # Angular velocities of all spheres except the current one
-                w2 = self._arr_del(arr = w[m-1], n = n, GPU = GPU, axis = 0)
-                # Radii of all spheres except the current one
-                r2 = self._arr_del(arr = radius, n = n, GPU = GPU, axis = 0)
-                # Vectors pointing from each sphere, toward the current one
-                d2 = self._arr_del(arr = x[m-1], n = n, GPU = GPU, axis = 0)\
-                     - x[m-1,n]
-                # Distances between current sphere, and all others
-                dn = mod.linalg.norm(d2, axis = 1)[:,np.newaxis]
-                # Sum over total gravitational and Coulomb accelerations
-                a = self._a_inv_square(m1 = mass[n], m2 = m2, d2 = d2, dn = dn,
-                                       q1 = charge[n], q2 = q2, G = G, k = k,
-                                       mod = mod)
-                if collision:
-                    # Including acceleration from intersphere collisions
-                    a = a + self._a_collision(m1 = mass[n], m2 = m2,
-                        r1 = radius[n], r2 = r2, v1 = v[m-1,n], v2 = v2,
-                        w1 = w[m-1,n], w2 = w2, d2 = d2, dn = dn, cf = cf,
-                        mod = mod, dt = dt)
-
-                # Verlet half-step velocity
-                v_half[n] = v[m-1,n] + dt*0.5*a
-                w_half[n] = w[m-1,n] + dt*0.5*a
-                # Updating new position
-                x[m,n] = x[m-1,n] + dt*v_half[n]
+                a[n] = self._tree_force(n, root, x_step, mass, charge, G, k,
+                                        theta)
+            # Display countdown timer
+            if debug:
+                counter()
+            return a
 
+        # Velocity Verlet Integration
+        for m in range(1, steps):
+            # Alternating halves of the ping-pong scratch
+            prev = (m - 1) & 1
+            curr = m & 1
+
+            if numba_active:
+                verlet_step(x_scr[prev], v_scr[prev], w_scr[prev],
+                            x_scr[curr], v_scr[curr], w_scr[curr],
+                            mass, charge, radius, G, k, cf, dt, collision)
                 # Display countdown timer
                 if debug:
                     counter()
+                    counter()
+            else:
+                if tree:
+                    a = a_tree(x_scr[prev])
+                else:
+                    a = a_direct(x_scr[prev], v_scr[prev])
 
-            # Loop over each sphere
-            for n in range(0, self.N):
-                # Masses of all spheres except the current one
-                m2 = self._arr_del(arr = mass, n = n, GPU = GPU, axis = 0)
-                # Charges of all spheres except the current one
-                q2 = self._arr_del(arr = charge, n = n, GPU = GPU, axis = 0)
-                # Velocities of all spheres except the current one
-                v2 = self._arr_del(arr = v[m], n = n, GPU = GPU, axis = 0)
-                # Angular velocities of all spheres except the current one
-                w2 = self._arr_del(arr = w[m], n = n, GPU = GPU, axis = 0)
-                # Radii of all spheres except the current one
-                r2 = self._arr_del(arr = radius, n = n, GPU = GPU, axis = 0)
-                # Vectors pointing from each sphere, toward the current one
-                d2 = self._arr_del(arr = x[m] - x[m,n], n = n, GPU = GPU,
-                                   axis = 0)
-                # Distances between current sphere, and all others
-                dn = mod.linalg.norm(d2, axis = 1)[:,np.newaxis]
-                # Sum over total gravitational and Coulomb accelerations
-                a = self._a_inv_square(m1 = mass[n], m2 = m2, d2 = d2, dn = dn,
-                                       q1 = charge[n], q2 = q2, G = G, k = k,
-                                       mod = mod)
-                if collision:
-                    # Including acceleration from intersphere collisions
-                    a = a + self._a_collision(m1 = mass[n], m2 = m2,
-                        r1 = radius[n], r2 = r2, v1 = v[m,n], v2 = v2,
-                        w1 = w[m,n], w2 = w2, d2 = d2, dn = dn, cf = cf,
-                        mod = mod, dt = dt)
+                # Verlet half-step velocity
+                v_half = v_scr[prev] + dt*0.5*a
+                w_half = w_scr[prev] + dt*0.5*a
+                # Updating new position
+                x_scr[curr] = x_scr[prev] + dt*v_half
+
+                if tree:
+                    a = a_tree(x_scr[curr])
+                else:
+                    a = a_direct(x_scr[curr], v_half)
 
                 # Updating new velocity
-                v[m,n] = v_half[n] + dt*0.5*a
+                v_scr[curr] = v_half + dt*0.5*a
+                w_scr[curr] = w_half + dt*0.5*a
 
-                # Display countdown timer
-                if debug:
-                    counter()
+            # Recording the current state in the downsampled trajectory
+            if m % save_every == 0:
+                x[m//save_every] = x_scr[curr]
+                v[m//save_every] = v_scr[curr]
+                w[m//save_every] = w_scr[curr]
 
         # Display total time elapsed
         if debug:
@@ -365,8 +572,8 @@ class System:
             x = cp.asnumpy(x)
             v = cp.asnumpy(v)
 
-        # Saving array of time-steps
-        self.t = np.linspace(0, T, steps)
+        # Saving array of recorded time-steps
+        self.t = dt*save_every*np.arange(frames)
         self.x = x
         self.v = v
         self.w = w
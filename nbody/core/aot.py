@@ -0,0 +1,37 @@
+"""
+    Ahead-of-time compilation of the generic Verlet kernel; running
+
+        python -m nbody.core.aot
+
+    once (e.g. as a post-install step) builds a 'kernels_aot' extension
+    module next to this file.  The extension needs no numba at runtime, so
+    'System.solve' can fall back on it where numba is not installed, and
+    no first-call JIT latency is ever paid.
+
+    The ahead-of-time compiler has no parallel target, so the exported
+    kernels run serially; where numba is available, the cached parallel
+    JIT kernels in 'kernels' are preferred.
+"""
+
+from numba.pycc import CC
+from numba import float32, float64, boolean, void
+import os
+
+from .kernels import _verlet_step
+
+cc = CC('kernels_aot')
+cc.output_dir = os.path.dirname(os.path.abspath(__file__))
+
+_aot_sigs = {"verlet_step_f8": float64, "verlet_step_f4": float32}
+
+for _name, _f in _aot_sigs.items():
+    cc.export(_name, void(_f[:,::1], _f[:,::1], _f[:,::1],
+                          _f[:,::1], _f[:,::1], _f[:,::1],
+                          _f[:,::1], _f[:,::1], _f[:,::1],
+                          _f, _f, _f, _f, boolean))(_verlet_step.py_func)
+
+if __name__ == "__main__":
+
+    print("Compiling 'kernels_aot' – this is a one-shot step")
+    cc.compile()
+    print(f"Done – extension written to {cc.output_dir}")
@@ -0,0 +1,300 @@
+"""
+    Numba-compiled kernels for the velocity Verlet integrator; these mirror
+    the batched numpy computation in 'System.solve', but run the pairwise
+    loops as compiled machine code, parallelized over the spheres.
+
+    The 2-D and 3-D cases get specialized kernels that work on transposed
+    (p,N) state arrays, so each axis is one contiguous (N,) column; the inner
+    loop over the other spheres then runs at unit stride per axis, which lets
+    LLVM auto-vectorize it into SIMD lanes across spheres.  Other
+    dimensionalities fall back on a generic (N,p) kernel.
+"""
+
+from numba import njit, prange, float32, float64, boolean, void, int64
+from numba import get_num_threads
+import numpy as np
+
+# The kernels are compiled eagerly for both float64 and float32 state, so
+# neither precision pays the LLVM compile cost on the first solve() call
+_step_sigs = [void(f[:,::1], f[:,::1], f[:,::1],
+                   f[:,::1], f[:,::1], f[:,::1],
+                   f[:,::1], f[:,::1], f[:,::1],
+                   f, f, f, f, boolean)
+              for f in (float64, float32)]
+
+_accel_sigs = [f[:,::1](f[:,::1], f[:,::1], f[::1], f[::1], f[::1],
+                        f, f, f, f, boolean, int64)
+               for f in (float64, float32)]
+
+@njit(fastmath = True, cache = True)
+def _sphere_accel(i, x, v, mass, charge, radius, G, k, cf, dt, collision):
+    """
+        Calculates the total acceleration on sphere 'i' due to gravitational
+        and Coulomb interactions, and optionally collisions, from all other
+        spheres; accumulates scalars in-register instead of allocating
+        pairwise arrays
+    """
+    N, p = x.shape
+    a = np.zeros(p)
+    # Sphere i's Coulomb factor is invariant over the inner loop
+    kq_i = k*charge[i,0]/mass[i,0]
+    for j in range(N):
+        if j == i:
+            continue
+        # Squared distance between spheres i and j
+        r2 = 0.0
+        for d in range(p):
+            dd = x[j,d] - x[i,d]
+            r2 += dd*dd
+        # Inverse cube distance, for the inverse square law
+        inv_r3 = r2**-1.5
+        # Gravitational and Coulomb coefficient for the pair
+        coef = (G*mass[j,0] + kq_i*charge[j,0])*inv_r3
+        for d in range(p):
+            a[d] += coef*(x[j,d] - x[i,d])
+
+        if collision:
+            r_sum = radius[i,0] + radius[j,0]
+            if r2 <= r_sum*r_sum:
+                # Find acceleration by conservation laws for elastic
+                # collisions
+                m_sum = mass[i,0] + mass[j,0]
+                a_c2 = 0.0
+                for d in range(p):
+                    a_c = (v[i,d]*(mass[i,0] - mass[j,0])/m_sum
+                           + 2*mass[j,0]*v[j,d]/m_sum)
+                    a_c2 += a_c*a_c
+                coef_c = cf*np.sqrt(a_c2)/(np.sqrt(r2)*dt)
+                for d in range(p):
+                    a[d] -= coef_c*(x[j,d] - x[i,d])
+    return a
+
+@njit(_step_sigs, parallel = True, fastmath = True, cache = True)
+def _verlet_step(x_prev, v_prev, w_prev, x_new, v_new, w_new, mass, charge,
+                 radius, G, k, cf, dt, collision):
+    """
+        Performs one full velocity Verlet step, reading the state at the
+        previous time-step from 'x_prev', 'v_prev', and 'w_prev', and writing
+        the new state into 'x_new', 'v_new', and 'w_new'; the outer loops
+        over the spheres run in parallel
+    """
+    N, p = x_prev.shape
+    v_half = np.empty((N, p), x_prev.dtype)
+    w_half = np.empty((N, p), x_prev.dtype)
+
+    # Loop over each sphere
+    for i in prange(N):
+        a = _sphere_accel(i, x_prev, v_prev, mass, charge, radius, G, k, cf,
+                          dt, collision)
+        for d in range(p):
+            # Verlet half-step velocity
+            v_half[i,d] = v_prev[i,d] + dt*0.5*a[d]
+            w_half[i,d] = w_prev[i,d] + dt*0.5*a[d]
+            # Updating new position
+            x_new[i,d] = x_prev[i,d] + dt*v_half[i,d]
+
+    # Loop over each sphere
+    for i in prange(N):
+        a = _sphere_accel(i, x_new, v_half, mass, charge, radius, G, k, cf,
+                          dt, collision)
+        for d in range(p):
+            # Updating new velocity
+            v_new[i,d] = v_half[i,d] + dt*0.5*a[d]
+            w_new[i,d] = w_half[i,d] + dt*0.5*a[d]
+
+@njit(_accel_sigs, parallel = True, fastmath = True, cache = True)
+def _accel_2D(xT, vT, m, q, r, G, k, cf, dt, collision, n_threads):
+    """
+        Calculates the accelerations on all spheres in 2-D, given transposed
+        (2,N) position and velocity arrays; each axis is a contiguous (N,)
+        column, so the inner loop auto-vectorizes across the spheres
+    """
+    N = xT.shape[1]
+    x0, x1 = xT[0], xT[1]
+    v0, v1 = vT[0], vT[1]
+
+    # Per-particle constants; the masses and charges never change, so G*m,
+    # k*q, and 1/m are formed in one O(N) pass, keeping the constant
+    # multiplies and the division out of the O(N²) inner loop
+    Gm = G*m
+    kq = k*q
+    inv_m = 1.0/m
+
+    # Newton's third law: each pair is visited once (i < j), and its force
+    # is scattered into both spheres' slots.  Each parallel iteration owns
+    # one stripe of the outer loop and one slab of the partial sums, which
+    # are reduced at the end; the striding balances the triangular loads
+    partial = np.zeros((n_threads, 2, N), xT.dtype)
+
+    # Loop over each pair of spheres, striped across the threads
+    for tid in prange(n_threads):
+        for i in range(tid, N, n_threads):
+            xi0, xi1 = x0[i], x1[i]
+            vi0, vi1 = v0[i], v1[i]
+            mi, qi, ri = m[i], q[i], r[i]
+            inv_mi = 1.0/mi
+            ai0 = 0.0
+            ai1 = 0.0
+            for j in range(i + 1, N):
+                dx0 = x0[j] - xi0
+                dx1 = x1[j] - xi1
+                # Squared distance between spheres i and j
+                r2 = dx0*dx0 + dx1*dx1
+                # Symmetric gravitational and Coulomb force for the pair
+                f = (mi*Gm[j] + qi*kq[j])*r2**-1.5
+                ai0 += f*inv_mi*dx0
+                ai1 += f*inv_mi*dx1
+                partial[tid,0,j] -= f*inv_m[j]*dx0
+                partial[tid,1,j] -= f*inv_m[j]*dx1
+
+                if collision:
+                    r_sum = ri + r[j]
+                    if r2 <= r_sum*r_sum:
+                        # Find accelerations by conservation laws for elastic
+                        # collisions; the collision term is not symmetric, but
+                        # both directions come from the same pair visit
+                        m_sum = mi + m[j]
+                        inv_dn = cf/(np.sqrt(r2)*dt)
+                        a_c0 = vi0*(mi - m[j])/m_sum + 2*m[j]*v0[j]/m_sum
+                        a_c1 = vi1*(mi - m[j])/m_sum + 2*m[j]*v1[j]/m_sum
+                        coef_c = np.sqrt(a_c0*a_c0 + a_c1*a_c1)*inv_dn
+                        ai0 -= coef_c*dx0
+                        ai1 -= coef_c*dx1
+                        a_c0 = v0[j]*(m[j] - mi)/m_sum + 2*mi*vi0/m_sum
+                        a_c1 = v1[j]*(m[j] - mi)/m_sum + 2*mi*vi1/m_sum
+                        coef_c = np.sqrt(a_c0*a_c0 + a_c1*a_c1)*inv_dn
+                        partial[tid,0,j] += coef_c*dx0
+                        partial[tid,1,j] += coef_c*dx1
+            partial[tid,0,i] += ai0
+            partial[tid,1,i] += ai1
+
+    # Reducing the per-thread partial sums
+    a = partial.sum(axis = 0)
+    return a
+
+@njit(_accel_sigs, parallel = True, fastmath = True, cache = True)
+def _accel_3D(xT, vT, m, q, r, G, k, cf, dt, collision, n_threads):
+    """
+        Calculates the accelerations on all spheres in 3-D, given transposed
+        (3,N) position and velocity arrays; each axis is a contiguous (N,)
+        column, so the inner loop auto-vectorizes across the spheres
+    """
+    N = xT.shape[1]
+    x0, x1, x2 = xT[0], xT[1], xT[2]
+    v0, v1, v2 = vT[0], vT[1], vT[2]
+
+    # Per-particle constants; the masses and charges never change, so G*m,
+    # k*q, and 1/m are formed in one O(N) pass, keeping the constant
+    # multiplies and the division out of the O(N²) inner loop
+    Gm = G*m
+    kq = k*q
+    inv_m = 1.0/m
+
+    # Newton's third law: each pair is visited once (i < j), and its force
+    # is scattered into both spheres' slots.  Each parallel iteration owns
+    # one stripe of the outer loop and one slab of the partial sums, which
+    # are reduced at the end; the striding balances the triangular loads
+    partial = np.zeros((n_threads, 3, N), xT.dtype)
+
+    # Loop over each pair of spheres, striped across the threads
+    for tid in prange(n_threads):
+        for i in range(tid, N, n_threads):
+            xi0, xi1, xi2 = x0[i], x1[i], x2[i]
+            vi0, vi1, vi2 = v0[i], v1[i], v2[i]
+            mi, qi, ri = m[i], q[i], r[i]
+            inv_mi = 1.0/mi
+            ai0 = 0.0
+            ai1 = 0.0
+            ai2 = 0.0
+            for j in range(i + 1, N):
+                dx0 = x0[j] - xi0
+                dx1 = x1[j] - xi1
+                dx2 = x2[j] - xi2
+                # Squared distance between spheres i and j
+                r2 = dx0*dx0 + dx1*dx1 + dx2*dx2
+                # Symmetric gravitational and Coulomb force for the pair
+                f = (mi*Gm[j] + qi*kq[j])*r2**-1.5
+                ai0 += f*inv_mi*dx0
+                ai1 += f*inv_mi*dx1
+                ai2 += f*inv_mi*dx2
+                partial[tid,0,j] -= f*inv_m[j]*dx0
+                partial[tid,1,j] -= f*inv_m[j]*dx1
+                partial[tid,2,j] -= f*inv_m[j]*dx2
+
+                if collision:
+                    r_sum = ri + r[j]
+                    if r2 <= r_sum*r_sum:
+                        # Find accelerations by conservation laws for elastic
+                        # collisions; the collision term is not symmetric, but
+                        # both directions come from the same pair visit
+                        m_sum = mi + m[j]
+                        inv_dn = cf/(np.sqrt(r2)*dt)
+                        a_c0 = vi0*(mi - m[j])/m_sum + 2*m[j]*v0[j]/m_sum
+                        a_c1 = vi1*(mi - m[j])/m_sum + 2*m[j]*v1[j]/m_sum
+                        a_c2 = vi2*(mi - m[j])/m_sum + 2*m[j]*v2[j]/m_sum
+                        coef_c = np.sqrt(a_c0*a_c0 + a_c1*a_c1 + a_c2*a_c2)\
+                                 *inv_dn
+                        ai0 -= coef_c*dx0
+                        ai1 -= coef_c*dx1
+                        ai2 -= coef_c*dx2
+                        a_c0 = v0[j]*(m[j] - mi)/m_sum + 2*mi*vi0/m_sum
+                        a_c1 = v1[j]*(m[j] - mi)/m_sum + 2*mi*vi1/m_sum
+                        a_c2 = v2[j]*(m[j] - mi)/m_sum + 2*mi*vi2/m_sum
+                        coef_c = np.sqrt(a_c0*a_c0 + a_c1*a_c1 + a_c2*a_c2)\
+                                 *inv_dn
+                        partial[tid,0,j] += coef_c*dx0
+                        partial[tid,1,j] += coef_c*dx1
+                        partial[tid,2,j] += coef_c*dx2
+            partial[tid,0,i] += ai0
+            partial[tid,1,i] += ai1
+            partial[tid,2,i] += ai2
+
+    # Reducing the per-thread partial sums
+    a = partial.sum(axis = 0)
+    return a
+
+def verlet_step(x_prev, v_prev, w_prev, x_new, v_new, w_new, mass, charge,
+                radius, G, k, cf, dt, collision):
+    """
+        Performs one full velocity Verlet step; dispatches to the SoA
+        column kernels for the 2-D and 3-D cases, and to the generic (N,p)
+        kernel otherwise
+    """
+    p = x_prev.shape[1]
+    # Matching the scalars to the state's precision, so the dispatcher
+    # selects the right compiled specialization
+    real = x_prev.dtype.type
+    G, k, cf, dt = real(G), real(k), real(cf), real(dt)
+    if p == 2:
+        accel = _accel_2D
+    elif p == 3:
+        accel = _accel_3D
+    else:
+        _verlet_step(x_prev, v_prev, w_prev, x_new, v_new, w_new, mass,
+                     charge, radius, G, k, cf, dt, collision)
+        return
+
+    # Transposing the state into contiguous per-axis columns
+    xT = np.ascontiguousarray(x_prev.T)
+    vT = np.ascontiguousarray(v_prev.T)
+    m = np.ascontiguousarray(mass[:,0])
+    q = np.ascontiguousarray(charge[:,0])
+    r = np.ascontiguousarray(radius[:,0])
+
+    n_threads = get_num_threads()
+
+    a = accel(xT, vT, m, q, r, G, k, cf, dt, collision, n_threads)
+
+    # Verlet half-step velocity
+    vT_half = vT + dt*0.5*a
+    wT_half = w_prev.T + dt*0.5*a
+    # Updating new position
+    xT = np.ascontiguousarray(xT + dt*vT_half)
+
+    a = accel(xT, np.ascontiguousarray(vT_half), m, q, r, G, k, cf, dt,
+              collision, n_threads)
+
+    # Writing the new state back in (N,p) layout
+    x_new[:] = xT.T
+    v_new[:] = (vT_half + dt*0.5*a).T
+    w_new[:] = (wT_half + dt*0.5*a).T
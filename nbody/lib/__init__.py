@@ -1,3 +1,3 @@
 from .generators import spheres, lattice, rand
 from .visualizer import animate
-from .io import save, load
+from .io import save, load, flush, checkpoint
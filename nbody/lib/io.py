@@ -1,77 +1,542 @@
-from ..core import System
+from .generators import spheres
 
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
 import numpy as np
+import threading
+import struct
+import atexit
+import queue
+import json
 import os
 
-def save(system, dirname = "nBody_save_"):
-    # Create a folder in which to save files
-    if not os.path.isdir("saved"):
-        os.mkdir("saved")
+# Alignment of the .npy data payload; one page, so memory-mapped reloads
+# map the payload directly onto whole pages
+_HEADER_ALIGN = 4096
+
+# Fixed little-endian layout of metadata.bin: dt and T as doubles, then
+# GPU_active and collision as single bytes.  18 bytes total, written and
+# parsed in one struct call instead of formatting and splitting text
+_METADATA_FMT = "<dd??"
+
+try:
+    import h5py
+    h5py_imported = True
+except ImportError:
+    h5py_imported = False
+
+try:
+    import blosc2
+    blosc2_imported = True
+except ImportError:
+    blosc2_imported = False
+
+# Work queue feeding the background writer thread; started lazily by the
+# first non-blocking save
+_write_queue = None
+
+# Two rotating staging buffers for non-blocking snapshots; steady-state
+# checkpointing then reuses the same memory instead of allocating a fresh
+# copy of the state per save.  Each slot's event is set once the writer
+# has drained it, so a slot is never overwritten while still queued
+_staging = [None, None]
+_staging_done = [threading.Event(), threading.Event()]
+for _event in _staging_done:
+    _event.set()
+_staging_idx = 0
+
+def _stage_snapshot(arrays):
+    """
+        Copies the arrays into the next rotating staging slot and returns
+        the buffers together with the slot index; blocks only if both
+        slots are still queued behind unfinished writes.  The buffers are
+        re-allocated whenever the shapes or dtypes change
+    """
+    global _staging_idx
+    slot = _staging_idx
+    _staging_done[slot].wait()
+    _staging_done[slot].clear()
+    bufs = _staging[slot]
+    if (bufs is None or set(bufs) != set(arrays)
+            or any(bufs[name].shape != arr.shape
+                   or bufs[name].dtype != arr.dtype
+                   for name, arr in arrays.items())):
+        bufs = {name: np.empty(arr.shape, arr.dtype)
+                for name, arr in arrays.items()}
+        _staging[slot] = bufs
+    for name, arr in arrays.items():
+        np.copyto(bufs[name], arr)
+    _staging_idx = (slot + 1) & 1
+    return bufs, slot
+
+def _writer_loop():
+    while True:
+        task = _write_queue.get()
+        try:
+            task()
+        except Exception as e:
+            # A failed snapshot must not kill the writer for the ones
+            # still queued behind it
+            print(f"Background save failed: {e}")
+        finally:
+            _write_queue.task_done()
+
+def _enqueue(task):
+    global _write_queue
+    if _write_queue is None:
+        _write_queue = queue.Queue()
+        worker = threading.Thread(target = _writer_loop, daemon = True)
+        worker.start()
+        # Draining the queue before interpreter shutdown, so queued
+        # snapshots are never lost to the daemon flag
+        atexit.register(flush)
+    _write_queue.put(task)
+
+def flush():
+    """
+        Blocks until every snapshot queued by save(..., blocking = False)
+        has been written to disk
+    """
+    if _write_queue is not None:
+        _write_queue.join()
+
+def _write_aligned_header(outfile, arr):
+    """
+        Writes a standard .npy v1.0 header for 'arr', padded with spaces so
+        the data payload starts on a '_HEADER_ALIGN' boundary; aligned
+        payloads let np.load(..., mmap_mode='r') map the data onto whole
+        pages, and any .npy reader still parses the file as usual
+    """
+    buf = BytesIO()
+    np.lib.format.write_array_header_1_0(
+        buf, np.lib.format.header_data_from_array_1_0(arr))
+    raw = buf.getvalue()
+    # Growing the header text – everything between the 10 magic/length
+    # bytes and the terminating newline – up to the alignment boundary
+    pad = -len(raw) % _HEADER_ALIGN
+    header = raw[10:-1] + b" "*pad + b"\n"
+    outfile.write(raw[:8])
+    outfile.write(len(header).to_bytes(2, "little"))
+    outfile.write(header)
+
+def _save_array(path, arr):
+    """
+        Writes 'arr' to a .npy file by handing its buffer to the file
+        directly through the buffer protocol; this skips both the
+        intermediate bytes copy of a tobytes()-style serialization and the
+        extra pass through a memory-mapped staging area, so the data is
+        read from the array exactly once
+    """
+    # The buffer protocol exposes the array as-is, so a non-contiguous
+    # array is compacted first (one copy, same as np.save would make)
+    if not arr.flags["C_CONTIGUOUS"]:
+        arr = np.ascontiguousarray(arr)
+    buf = BytesIO()
+    _write_aligned_header(buf, arr)
+    header = buf.getvalue()
+    payload = memoryview(arr).cast("B")
+    # buffering=0 hands the buffers straight to the kernel, and the
+    # scatter-gather writev emits header and payload in one syscall
+    with open(path, "wb", buffering = 0) as outfile:
+        written = os.writev(outfile.fileno(), [header, payload])
+        # writev may stop short on very large payloads; finishing with
+        # plain writes of the remainder
+        while written < len(header) + len(payload):
+            if written < len(header):
+                written += os.write(outfile.fileno(), header[written:])
+            else:
+                written += os.write(outfile.fileno(),
+                                    payload[written - len(header):])
+
+def _save_blosc2(path, arr):
+    """
+        Writes 'arr' as a blosc2 frame; the SIMD bit-shuffle filter and the
+        multi-threaded zstd codec usually make the compressed write faster
+        than an uncompressed one when the target disk or network is the
+        bottleneck
+    """
+    if not blosc2_imported:
+        raise ImportError("Package 'blosc2' required for blosc2 "
+                          "compression")
+    blosc2.save_array(np.ascontiguousarray(arr), path, mode = "w")
+
+def _save_raw(path, arr):
+    """
+        Dumps the bare bytes of 'arr' with tofile(); no header and no
+        intermediate serialization at all.  The shape and dtype must be
+        recorded separately (save() keeps them in a shapes.json sidecar)
+    """
+    if not arr.flags["C_CONTIGUOUS"]:
+        arr = np.ascontiguousarray(arr)
+    arr.tofile(path)
+
+def _drop_page_cache(path):
+    """
+        Advises the kernel to evict the file's pages from the page cache;
+        a freshly written checkpoint is rarely read back by this process,
+        and letting it linger evicts the live simulation's working set
+    """
+    # Not available on every platform; silently skipped where missing
+    if not hasattr(os, "posix_fadvise"):
+        return
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+    finally:
+        os.close(fd)
+
+def _write_bytes(path, data):
+    """
+        Writes a small file in one shot; the whole content is built in
+        memory first, so each file costs exactly one open, one write, and
+        one close syscall, with no buffered io layer in between
+    """
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.write(fd, data)
+    finally:
+        os.close(fd)
+
+def _write_text(path, text):
+    _write_bytes(path, text.encode())
+
+def _pack_metadata(system):
+    """
+        Packs the scalar simulation parameters into the fixed
+        '_METADATA_FMT' layout
+    """
+    return struct.pack(_METADATA_FMT, system.dt, system.T,
+                       system.GPU_active, system.collision)
+
+def _save_hdf5(path, arrays):
+    """
+        Writes all the arrays into a single chunked HDF5 container; the
+        chunking allows partial reads, and appending tools can extend the
+        datasets without rewriting the whole file
+    """
+    if not h5py_imported:
+        raise ImportError("Package 'h5py' required to save in HDF5 format")
+    with h5py.File(path, "w", libver = "latest") as outfile:
+        for name, arr in arrays.items():
+            outfile.create_dataset(name, data = arr, chunks = True)
+
+def save(system, dirname = "nBody_save_", fmt = "npz",
+         separate_files = False, checkpoint_interval = 1, final = False,
+         save_dtype = None, blocking = True, compression = "none",
+         drop_cache = False):
+    # Callers that checkpoint from a loop can raise 'checkpoint_interval'
+    # to only write every so many calls; the skipped calls cost one counter
+    # increment.  'final' forces the write regardless, so the last state of
+    # a run is never dropped
+    if checkpoint_interval > 1:
+        count = getattr(system, "_save_counter", 0) + 1
+        system._save_counter = count
+        if not final and count % checkpoint_interval != 0:
+            return
+    # Validating the arguments before any directory is created, so a bad
+    # call neither leaves an empty save directory behind nor consumes an
+    # auto-numbered ID
+
+    # The old flag maps onto the per-file layout
+    if separate_files:
+        fmt = "npy"
+    if fmt not in ("npz", "npy", "hdf5", "raw"):
+        msg = (f"Argument 'fmt' in 'save' must be one of 'npz', 'npy', "
+               f"'hdf5', or 'raw'; got '{fmt}'.")
+        raise ValueError(msg)
+    # Compression trades CPU for bytes on the wire, which pays off when
+    # the target is a network filesystem or cold storage; 'zlib' rides on
+    # the stdlib through savez_compressed, 'blosc2' uses the much faster
+    # optional blosc2 package and overrides the layout with per-array
+    # frames
+    if compression not in ("none", "zlib", "blosc2"):
+        msg = (f"Argument 'compression' in 'save' must be one of 'none', "
+               f"'zlib', or 'blosc2'; got '{compression}'.")
+        raise ValueError(msg)
+    if compression == "zlib" and fmt != "npz":
+        msg = "Compression 'zlib' is only available with fmt='npz'."
+        raise ValueError(msg)
+
     dirname = f"saved/{dirname}"
     # If dirname ends in "_", will automatically number the save directory
     if dirname[-1] == "_":
-        ID = 0.0
-        # Iterating through files until an unused number is found
-        while True:
-            ID_text = f"{ID:03.0f}"
-            if os.path.isdir(dirname + ID_text):
-                # If current number is used, increments to check next one
-                ID += 1
+        ID = 0
+        # Iterating through directories until an unused number is found
+        while os.path.isdir(f"{dirname}{ID:03d}"):
+            ID += 1
+        dirname = f"{dirname}{ID:03d}"
+    # One call builds the whole saved/…/arr tree, tolerating whatever part
+    # of it already exists; no stat-then-mkdir races
+    os.makedirs(f"{dirname}/arr", exist_ok = True)
+
+    arrays = {"t": system.t, "x": system.x, "v": system.v, "w": system.w,
+              "m": system.m, "q": system.q, "r": system.r}
+
+    # Compacting any non-contiguous array once, up front; every writer can
+    # then hand its buffer out zero-copy, instead of each format path
+    # falling back on its own hidden ascontiguousarray.  solve() produces
+    # C-contiguous arrays, so this normally costs nothing
+    for name, arr in arrays.items():
+        if not arr.flags["C_CONTIGUOUS"]:
+            arrays[name] = np.ascontiguousarray(arr)
+
+    # Optionally quantizing the trajectory payload (e.g. to float16) to
+    # cut write bandwidth; the masses, charges, and radii are tiny and
+    # feed later solves, so they keep their dtype.  astype(copy=False) is
+    # free when the dtype already matches
+    if save_dtype is not None:
+        for name in ("t", "x", "v", "w"):
+            arrays[name] = arrays[name].astype(save_dtype, copy = False)
+
+    # Metadata, such as time steps, simulation runtime, etc., rendered
+    # now, so a deferred write sees the state at call time
+    metadata = _pack_metadata(system)
+
+    # The human-readable parameter log only changes when a solve parameter
+    # does; caching the rendered string on the system skips re-formatting
+    # it on every save, and hashing it lets repeated saves into the same
+    # directory skip the log.txt rewrite entirely
+    log_key = (system.N, system.p, system.T, system.dt,
+               system.GPU_active, system.collision)
+    if getattr(system, "_log_cache_key", None) != log_key:
+        system._log_cache_key = log_key
+        system._log_cache = system.simulation_info()
+        system._log_written = {}
+    log = system._log_cache
+    log_hash = hash(log)
+
+    def write_out(arrays):
+        # The writes release the GIL while in the kernel, so running them
+        # through a thread pool overlaps their I/O queue depth
+        with ThreadPoolExecutor(max_workers = len(arrays) + 2) as ex:
+            if compression == "blosc2":
+                # One compressed blosc2 frame per array
+                paths = {name: f"{dirname}/arr/{name}.b2"
+                         for name in arrays}
+                tasks = [ex.submit(_save_blosc2, paths[name], arr)
+                         for name, arr in arrays.items()]
+                paths = list(paths.values())
+            elif fmt == "npy":
+                # Saving the instance attributes to one .npy file apiece
+                paths = {name: f"{dirname}/arr/{name}.npy"
+                         for name in arrays}
+                tasks = [ex.submit(_save_array, paths[name], arr)
+                         for name, arr in arrays.items()]
+                paths = list(paths.values())
+            elif fmt == "hdf5":
+                # A single chunked HDF5 container holding all the arrays
+                paths = [f"{dirname}/arr/state.h5"]
+                tasks = [ex.submit(_save_hdf5, paths[0], arrays)]
+            elif fmt == "raw":
+                # Bare array bytes, with one shapes.json sidecar carrying
+                # the shape and dtype of every file.  The large trajectory
+                # arrays get one .raw file apiece; the small ones are
+                # packed back-to-back into a single small.bin, since the
+                # per-file overhead would dominate their few bytes
+                small_names = ("t", "m", "q", "r")
+                paths = [f"{dirname}/arr/{name}.raw"
+                         for name in arrays if name not in small_names]
+                paths.append(f"{dirname}/arr/small.bin")
+                tasks = [ex.submit(_save_raw, f"{dirname}/arr/{name}.raw",
+                                   arr)
+                         for name, arr in arrays.items()
+                         if name not in small_names]
+                shapes = {name: {"shape": list(arr.shape),
+                                 "dtype": str(arr.dtype)}
+                          for name, arr in arrays.items()
+                          if name not in small_names}
+                offset = 0
+                chunks = []
+                small = {}
+                for name in small_names:
+                    arr = arrays[name]
+                    chunks.append(arr.view("u1").ravel())
+                    small[name] = {"shape": list(arr.shape),
+                                   "dtype": str(arr.dtype),
+                                   "offset": offset}
+                    offset += arr.nbytes
+                shapes["small"] = small
+                tasks.append(ex.submit(_save_raw,
+                                       f"{dirname}/arr/small.bin",
+                                       np.concatenate(chunks)))
+                tasks.append(ex.submit(_write_text,
+                                       f"{dirname}/arr/shapes.json",
+                                       json.dumps(shapes)))
             else:
-                # If current number is available, creates save directories
-                dirname = dirname + ID_text
-                os.mkdir(dirname)
-                os.mkdir(dirname + "/arr")
-                break
-    elif not os.path.isdir(dirname):
-        # If unnumbered, creates save directory and array subdirectory
-        os.mkdir(dirname)
-        os.mkdir(dirname + "/arr")
+                # Bundling all the attributes into a single .npz; one file
+                # creation and close instead of seven
+                savez = np.savez_compressed if compression == "zlib" \
+                        else np.savez
+                paths = [f"{dirname}/arr/bundle.npz"]
+                tasks = [ex.submit(savez, paths[0], **arrays)]
+            tasks.append(ex.submit(_write_bytes, f"{dirname}/metadata.bin",
+                                   metadata))
+            # Skipping log.txt when this directory already holds an
+            # identical copy
+            write_log = system._log_written.get(dirname) != log_hash
+            if write_log:
+                tasks.append(ex.submit(_write_text, f"{dirname}/log.txt",
+                                       log))
+            # Propagating any exception raised in the workers
+            for task in tasks:
+                task.result()
+            if write_log:
+                system._log_written[dirname] = log_hash
+
+        # Optionally evicting the checkpoint's pages, so a large write
+        # doesn't push the live simulation's working set out of memory
+        if drop_cache:
+            for path in paths:
+                _drop_page_cache(path)
+
+    if blocking:
+        write_out(arrays)
     else:
-        # If unnumbered, and directory exists, creates array subdirectory
-        if not os.path.isdir(dirname + "/arr"):
-            os.mkdir(dirname + "/arr")
-
-    # Saving the instance attributes to .npy files
-    np.save(f"{dirname}/arr/t", system.t)
-    np.save(f"{dirname}/arr/x", system.x)
-    np.save(f"{dirname}/arr/v", system.v)
-    np.save(f"{dirname}/arr/w", system.w)
-    np.save(f"{dirname}/arr/m", system.m)
-    np.save(f"{dirname}/arr/q", system.q)
-    np.save(f"{dirname}/arr/r", system.r)
-
-    # Saving metadata, such as time steps, simulation runtime, etc...
-    with open(f"{dirname}/metadata.dat", "w+") as outfile:
-        msg = (f"dt={system.dt} T={system.T} GPU={system.GPU_active} "
-               f"col={system.collision}")
-        outfile.write(msg)
-
-    # Creates a human-readable log with info on simulation parameters
-    with open(f"{dirname}/log.txt", "w+") as outfile:
-        outfile.write(system.simulation_info())
+        # Staging the snapshot in one of the rotating buffers decouples
+        # the background writer from the live arrays without a fresh
+        # allocation per save; flush() joins the queue before the results
+        # are needed
+        snapshot, slot = _stage_snapshot(arrays)
+
+        def task():
+            try:
+                write_out(snapshot)
+            finally:
+                # Releasing the slot for reuse
+                _staging_done[slot].set()
+
+        _enqueue(task)
+
+def checkpoint(system, dirname = "nBody_checkpoint", max_steps = None):
+    """
+        Appends the system's trajectory to pre-sized .npy memory maps,
+        writing only the frames added since the previous call; calling the
+        full save() from a loop rewrites every frame each time, O(T²)
+        bytes over a run, where this path stays O(T)
+
+        The first call fixes the files' capacity at 'max_steps' frames
+        (defaulting to the current frame count) and writes the static
+        m/q/r arrays once; the directory is loadable with load() at any
+        point between calls
+    """
+    dirname = f"saved/{dirname}"
+    os.makedirs(f"{dirname}/arr", exist_ok = True)
+
+    frames = system.x.shape[0]
+    if getattr(system, "_ckpt_maps", None) is None:
+        capacity = frames if max_steps is None else int(max_steps)
+        # Creating the pre-sized trajectory maps; the .npy header is laid
+        # down once, and later calls only touch the new tail pages
+        system._ckpt_maps = {}
+        for name in ("t", "x", "v", "w"):
+            arr = getattr(system, name)
+            system._ckpt_maps[name] = np.lib.format.open_memmap(
+                f"{dirname}/arr/{name}.npy", mode = "w+",
+                dtype = arr.dtype, shape = (capacity,) + arr.shape[1:])
+        system._ckpt_step = 0
+        # The per-sphere constants never grow, so they are written once
+        for name in ("m", "q", "r"):
+            _save_array(f"{dirname}/arr/{name}.npy", getattr(system, name))
+
+    if frames > system._ckpt_maps["x"].shape[0]:
+        msg = (f"Checkpoint capacity of {system._ckpt_maps['x'].shape[0]:d}"
+               f" frames exceeded; pass a larger 'max_steps' on the first "
+               f"checkpoint call.")
+        raise ValueError(msg)
+
+    # Writing only the frames added since the last call
+    start = system._ckpt_step
+    for name in ("t", "x", "v", "w"):
+        fp = system._ckpt_maps[name]
+        fp[start:frames] = getattr(system, name)[start:frames]
+        fp.flush()
+    system._ckpt_step = frames
+
+    # Keeping the directory loadable on its own; frames.bin records how
+    # many frames are actually filled, so load() can trim the pre-sized
+    # maps' unwritten tail instead of returning zero-filled frames
+    _write_bytes(f"{dirname}/arr/frames.bin", struct.pack("<q", frames))
+    _write_bytes(f"{dirname}/metadata.bin", _pack_metadata(system))
 
 def load(dirname):
 
-    t = np.load(f"{dirname}/arr/t.npy")
-    x = np.load(f"{dirname}/arr/x.npy")
-    v = np.load(f"{dirname}/arr/v.npy")
-    w = np.load(f"{dirname}/arr/w.npy")
-    m = np.load(f"{dirname}/arr/m.npy")
-    q = np.load(f"{dirname}/arr/q.npy")
-    r = np.load(f"{dirname}/arr/r.npy")
-
-    I = Simulation(x[0], v[0], w[0], m, q, r)
-    I.t, I.x, I.v, I.w = t, x, v, w
-
-    with open(f"{dirname}/metadata.dat") as infile:
-        data = infile.read().split(" ")
-        I.dt = float(data[0].split("=")[1])
-        I.T = float(data[1].split("=")[1])
-        I.GPU = bool(data[2].split("=")[1])
-        I.collision = bool(data[3].split("=")[1])
-
-    return I
+    if os.path.isfile(f"{dirname}/arr/bundle.npz"):
+        # The bundled layout; all the arrays live in a single .npz
+        with np.load(f"{dirname}/arr/bundle.npz") as data:
+            t, x, v, w = data["t"], data["x"], data["v"], data["w"]
+            m, q, r = data["m"], data["q"], data["r"]
+    elif os.path.isfile(f"{dirname}/arr/state.h5"):
+        # The HDF5 container layout
+        if not h5py_imported:
+            raise ImportError("Package 'h5py' required to load HDF5 saves")
+        with h5py.File(f"{dirname}/arr/state.h5", "r") as data:
+            t, x, v, w = data["t"][:], data["x"][:], data["v"][:], \
+                         data["w"][:]
+            m, q, r = data["m"][:], data["q"][:], data["r"][:]
+    elif os.path.isfile(f"{dirname}/arr/x.b2"):
+        # The blosc2 layout; one compressed frame per array
+        if not blosc2_imported:
+            raise ImportError("Package 'blosc2' required to load blosc2 "
+                              "saves")
+        b2 = {name: blosc2.load_array(f"{dirname}/arr/{name}.b2")
+              for name in ("t", "x", "v", "w", "m", "q", "r")}
+        t, x, v, w = b2["t"], b2["x"], b2["v"], b2["w"]
+        m, q, r = b2["m"], b2["q"], b2["r"]
+    elif os.path.isfile(f"{dirname}/arr/shapes.json"):
+        # The raw layout; bare bytes plus the shape/dtype sidecar
+        with open(f"{dirname}/arr/shapes.json") as infile:
+            shapes = json.load(infile)
+        small = shapes.pop("small", {})
+        raw = {name: np.fromfile(f"{dirname}/arr/{name}.raw",
+                                 dtype = info["dtype"])
+                     .reshape(info["shape"])
+               for name, info in shapes.items()}
+        if small:
+            # Unpacking the small arrays from their shared file
+            packed = np.fromfile(f"{dirname}/arr/small.bin", dtype = "u1")
+            for name, info in small.items():
+                dtype = np.dtype(info["dtype"])
+                nbytes = dtype.itemsize*int(np.prod(info["shape"]))
+                start = info["offset"]
+                raw[name] = packed[start:start + nbytes].view(dtype) \
+                            .reshape(info["shape"])
+        t, x, v, w = raw["t"], raw["x"], raw["v"], raw["w"]
+        m, q, r = raw["m"], raw["q"], raw["r"]
+    else:
+        # The legacy layout, with one .npy file per array
+        t = np.load(f"{dirname}/arr/t.npy")
+        x = np.load(f"{dirname}/arr/x.npy")
+        v = np.load(f"{dirname}/arr/v.npy")
+        w = np.load(f"{dirname}/arr/w.npy")
+        m = np.load(f"{dirname}/arr/m.npy")
+        q = np.load(f"{dirname}/arr/q.npy")
+        r = np.load(f"{dirname}/arr/r.npy")
+
+    # A checkpoint directory's files are pre-sized to 'max_steps' frames;
+    # the frames.bin sidecar records how many were actually written, and
+    # the unwritten tail is dropped here
+    if os.path.isfile(f"{dirname}/arr/frames.bin"):
+        with open(f"{dirname}/arr/frames.bin", "rb") as infile:
+            frames = struct.unpack("<q", infile.read())[0]
+        t, x, v, w = t[:frames], x[:frames], v[:frames], w[:frames]
+
+    S = spheres(x0 = x[0], v0 = v[0], m = m, q = q, r = r)
+    S.t, S.x, S.v, S.w = t, x, v, w
+
+    if os.path.isfile(f"{dirname}/metadata.bin"):
+        with open(f"{dirname}/metadata.bin", "rb") as infile:
+            S.dt, S.T, S.GPU_active, S.collision = \
+                struct.unpack(_METADATA_FMT, infile.read())
+    else:
+        # The legacy text metadata, kept readable for old save directories
+        with open(f"{dirname}/metadata.dat") as infile:
+            data = infile.read().split(" ")
+            S.dt = float(data[0].split("=")[1])
+            S.T = float(data[1].split("=")[1])
+            S.GPU_active = data[2].split("=")[1] == "True"
+            S.collision = data[3].split("=")[1] == "True"
+
+    return S
 
 if __name__ == "__main__":
 
@@ -1,6 +1,6 @@
 from matplotlib.animation import FuncAnimation, writers
 import matplotlib.animation as animation
-from matplotlib.patches import Circle
+from matplotlib.collections import EllipseCollection
 import matplotlib.pyplot as plt
 from time import time
 import numpy as np
@@ -47,8 +47,9 @@ def _animate_2D(system, savename = None):
     # time step.  RGB is used with R = 1 and B = 0.  G is varied between
     # 0 and 1 depending on the sphere's speed in time
 
-    # Calculating sphere speeds
-    speeds = np.linalg.norm(system.v, axis = 2)
+    # Calculating sphere speeds; einsum contracts straight along the last
+    # axis, avoiding linalg.norm's general-purpose overhead
+    speeds = np.sqrt(np.einsum('ijk,ijk->ij', system.v, system.v))
     # Rescaling the speeds logarithmically
     speeds_scaled = np.log(speeds + np.min(speeds) + 1E-15)
     # Maximum log of shifted speed
@@ -58,26 +59,44 @@ def _animate_2D(system, savename = None):
     # Rescaling the speeds in range 0,1 and subtracting from 1
     colors_g = 1-((speeds_scaled - v_min)/(v_max-v_min))
 
-    # Initializing the circles as a list and appending them to the plot
-    circles = []
-    for i,j,k in zip(system.x[0], system.r, colors_g[0]):
-        # Creating a circle with initial position, radius, and RGB color
-        circles.append(Circle(tuple(i), j, color = (1,k,0)))
-        # Adding the above circle to the plot
-        ax.add_artist(circles[-1])
+    # Precomputing the RGBA color of every sphere at every time-step, so
+    # each frame is a single array lookup rather than N color conversions
+    rgba = np.stack([np.ones_like(colors_g), colors_g,
+                     np.zeros_like(colors_g),
+                     np.ones_like(colors_g)], axis = -1)
+
+    # A single collection holds all the spheres; moving and recoloring it
+    # is one C-level call per frame, instead of 2N attribute setters
+    diameters = 2*system.r[:,0]
+    circles = EllipseCollection(widths = diameters, heights = diameters,
+                                angles = 0, units = 'xy',
+                                offsets = system.x[0],
+                                offset_transform = ax.transData,
+                                facecolors = rgba[0])
+    ax.add_collection(circles)
 
     # Number of standard deviations to focus animation on
     devs = 3
 
-    # Animation initialization function
-    def init():
-        x0, x1 = system.x[0,:,0], system.x[0,:,1]
-        cond_0 = np.abs(x0 - np.mean(x0)) <= devs*np.std(x0)
-        cond_1 = np.abs(x1 - np.mean(x1)) <= devs*np.std(x1)
-        idx = np.logical_and(cond_0, cond_1)
+    # Precomputing the axis limits for every frame up front; the statistics
+    # and outlier filtering would otherwise run at frame-rate, alongside the
+    # matplotlib draw calls
+    steps = system.x.shape[0]
+
+    # Outlier mask for all frames in one batched pass; a sphere is kept in
+    # frame m only if it lies within 'devs' standard deviations of the mean
+    # along every axis
+    means = system.x.mean(axis = 1, keepdims = True)
+    stds = system.x.std(axis = 1, keepdims = True)
+    mask = np.all(np.abs(system.x - means) <= devs*stds, axis = 2)
+
+    xlims = np.empty((steps, 2))
+    ylims = np.empty((steps, 2))
+    for m in range(steps):
+        idx = mask[m]
         # Removing outliers
-        x0 = x0[idx]
-        x1 = x1[idx]
+        x0 = system.x[m,idx,0]
+        x1 = system.x[m,idx,1]
         # Calculating the limits of x, compensating for sphere radius
         xlim = np.min(x0-system.r[idx]), np.max(x0+system.r[idx])
         # Calculating the limits of y, compensating for sphere radius
@@ -89,58 +108,30 @@ def _animate_2D(system, savename = None):
         if xlim[1]-xlim[0] >= ylim[1]-ylim[0]:
             # If x has larger limits, scales y accordingly
             y_mid = (ylim[1] - ylim[0])/2 + ylim[0]
-            y_max = y_mid + scale/2
-            y_min = y_mid - scale/2
-            ax.set_xlim(xlim[0], xlim[1])
-            ax.set_ylim(y_min, y_max)
+            xlims[m] = xlim
+            ylims[m] = y_mid - scale/2, y_mid + scale/2
         else:
             # If y has larger limits, scales x accordingly
             x_mid = (xlim[1] - xlim[0])/2 + xlim[0]
-            x_max = x_mid + scale/2
-            x_min = x_mid - scale/2
-            ax.set_xlim(x_min, x_max)
-            ax.set_ylim(ylim[0], ylim[1])
+            xlims[m] = x_mid - scale/2, x_mid + scale/2
+            ylims[m] = ylim
+
+    # Animation initialization function
+    def init():
+        ax.set_xlim(*xlims[0])
+        ax.set_ylim(*ylims[0])
         return
 
     # Animation update frame function
     def update(m):
-        # Iterating through each circle, for a single step with index m
-        for n,c in enumerate(circles):
-            # Moving all circles to their new centers
-            c.center = tuple(system.x[m,n])
-            # Adjusting the green setting depending on current speed
-            c.set_color((1,colors_g[m,n],0))
-
-        x0, x1 = system.x[m,:,0], system.x[m,:,1]
-        cond_0 = np.abs(x0 - np.mean(x0)) <= devs*np.std(x0)
-        cond_1 = np.abs(x1 - np.mean(x1)) <= devs*np.std(x1)
-        idx = np.logical_and(cond_0, cond_1)
-        # Removing outliers
-        x0 = x0[idx]
-        x1 = x1[idx]
-
-        # Calculating the limits of x, compensating for sphere radius
-        xlim = (np.min(x0-system.r[idx]), np.max(x0+system.r[idx]))
-        # Calculating the limits of y, compensating for sphere radius
-        ylim = (np.min(x1-system.r[idx]), np.max(x1+system.r[idx]))
-        # Choosing the largest scale from xlim or ylim
-        scale = xlim if xlim[1]-xlim[0] >= ylim[1]-ylim[0] else ylim
-        # Taking the difference to calculate the largest scale
-        scale = scale[1] - scale[0]
-        if xlim[1]-xlim[0] >= ylim[1]-ylim[0]:
-            # If x has larger limits, scales y accordingly
-            y_mid = (ylim[1] - ylim[0])/2 + ylim[0]
-            y_max = y_mid + scale/2
-            y_min = y_mid - scale/2
-            ax.set_xlim(xlim[0], xlim[1])
-            ax.set_ylim(y_min, y_max)
-        else:
-            # If y has larger limits, scales x accordingly
-            x_mid = (xlim[1] - xlim[0])/2 + xlim[0]
-            x_max = x_mid + scale/2
-            x_min = x_mid - scale/2
-            ax.set_xlim(x_min, x_max)
-            ax.set_ylim(ylim[0], ylim[1])
+        # Moving all circles to their new centers
+        circles.set_offsets(system.x[m])
+        # Adjusting the green setting depending on current speeds
+        circles.set_facecolors(rgba[m])
+
+        # Looking up the precomputed limits for this frame
+        ax.set_xlim(*xlims[m])
+        ax.set_ylim(*ylims[m])
         return
 
     # The frame indices for each integration step
@@ -190,8 +181,9 @@ def _animate_3D(system, savename = None):
     # time step.  RGB is used with R = 1 and B = 0.  G is varied between
     # 0 and 1 depending on the sphere's speed in time
 
-    # Calculating sphere speeds
-    speeds = np.linalg.norm(system.v, axis = 2)
+    # Calculating sphere speeds; einsum contracts straight along the last
+    # axis, avoiding linalg.norm's general-purpose overhead
+    speeds = np.sqrt(np.einsum('ijk,ijk->ij', system.v, system.v))
     # Rescaling the speeds logarithmically
     speeds_scaled = np.log(speeds + np.min(speeds) + 1E-15)
     # Maximum log of shifted speed
@@ -1,25 +1,31 @@
 from time import time
-import numpy as np
 
 class Counter:
 
     def __init__(self, tot_iter):
         self.counter = 0
         self.t0 = time()
+        self.t_prev = self.t0
         self.perc = 0
         self.tot_iter = tot_iter
-        self.times = np.zeros(tot_iter)
+        self.ema = 0.0
         self.dt = 0
         print(f"\tStatus\t\t\tIn Progress {0:>3d}%", end = "")
 
     def __call__(self):
         self.counter += 1
-        new_perc = int(100*self.counter/self.tot_iter)
-        self.times[self.counter-1] = time()
-        if int(time() - self.t0) > self.dt and self.counter > 1:
-            self.perc = new_perc
-            t_avg = np.mean(np.diff(self.times[:self.counter]))
-            eta = t_avg*(self.tot_iter - self.counter)
+        now = time()
+        # Exponential moving average of the time per iteration; O(1) per
+        # tick, unlike a scan over the full iteration history
+        dt_iter = now - self.t_prev
+        self.t_prev = now
+        if self.counter == 1:
+            self.ema = dt_iter
+        else:
+            self.ema = 0.98*self.ema + 0.02*dt_iter
+        if int(now - self.t0) > self.dt and self.counter > 1:
+            self.perc = int(100*self.counter/self.tot_iter)
+            eta = self.ema*(self.tot_iter - self.counter)
             dd = int((eta//86400))
             hh = int((eta//3600)%24)
             mm = int((eta//60)%60)
@@ -29,7 +35,7 @@ class Counter:
                 msg += f"{dd:d} day(s) + "
             msg += f"{hh:02d}:{mm:02d}:{ss:02d}"
             print(msg, end = "")
-        self.dt = time() - self.t0
+        self.dt = now - self.t0
 
     def close(self):
         dt = time() - self.t0